@@ -1,21 +1,220 @@
-"""Odoo XML-RPC client wrapper.
+"""Odoo JSON-RPC client wrapper.
 
-Provides a clean interface over Odoo's XML-RPC API for common operations
+Provides a clean interface over Odoo's JSON-RPC API for common operations
 on projects, tasks, users, tags, and generic records.
 """
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import itertools
+import json
 import logging
 import os
-import xmlrpc.client
-from typing import Any
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator
+
+import httpx
+
+from odoo_mcp import jsonutil
 
 logger = logging.getLogger(__name__)
 
+_REQUEST_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Sized for the MCP server's RPC worker pool. httpx's default 5s keep-alive
+# expiry would drop the connection between most LLM tool calls.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=16, max_keepalive_connections=16, keepalive_expiry=60.0
+)
+_MAX_PARALLEL_CALLS = 8
+_UID_CACHE_TTL = 3600.0
+_VERSION_CACHE_TTL = 600.0
+_FIELDS_CACHE_TTL = 86400.0
+_RESULT_CACHE_TTL = float(os.environ.get("ODOO_MCP_CACHE_TTL", "30"))
+_RESULT_CACHE_SIZE = 256
+# Cached lookups of these models are also kept on disk so a respawned server
+# starts warm. User searches and milestones stay in memory only.
+_DISK_RESULT_TTL = float(os.environ.get("ODOO_MCP_DISK_CACHE_TTL", "3600"))
+_DISK_RESULT_MODELS = frozenset(
+    {"project.project", "project.task.type", "project.tags"}
+)
+_WRITE_METHODS = frozenset({"create", "write", "unlink"})
+# Models whose cached reads embed data from another model (task_count).
+_CACHE_DEPENDENTS: dict[str, tuple[str, ...]] = {"project.task": ("project.project",)}
+_request_ids = itertools.count(1)
+_UNRESOLVED = object()
+
+
+class OdooRPCError(Exception):
+    """An error returned by Odoo in a JSON-RPC response."""
+
+    def __init__(
+        self, message: str, name: str = "", code: int | None = None
+    ) -> None:
+        super().__init__(f"{name}: {message}" if name else message)
+        self.name = name
+        self.code = code
+
+
+def _rpc_payload(service: str, method: str, args: list) -> dict[str, Any]:
+    """Build the JSON-RPC envelope for a call on an Odoo service."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "call",
+        "params": {"service": service, "method": method, "args": args},
+        "id": next(_request_ids),
+    }
+
+
+def _rpc_result(body: dict[str, Any]) -> Any:
+    """Unwrap a JSON-RPC response body, raising on Odoo errors."""
+    error = body.get("error")
+    if error:
+        data = error.get("data") or {}
+        raise OdooRPCError(
+            data.get("message") or error.get("message", "Unknown Odoo error"),
+            name=data.get("name", ""),
+            code=error.get("code"),
+        )
+    return body.get("result")
+
+
+# ── Shared HTTP pool ────────────────────────────────────────────────
+
+_shared_http: httpx.Client | None = None
+_shared_http_lock = threading.Lock()
+
+
+def _get_shared_http() -> httpx.Client:
+    """Return the process-wide HTTP client used by every OdooClient.
+
+    Sharing one pool means short-lived clients still reuse warm keep-alive
+    connections. httpx.Client is thread-safe.
+    """
+    global _shared_http
+    if _shared_http is None:
+        with _shared_http_lock:
+            if _shared_http is None:
+                _shared_http = httpx.Client(
+                    timeout=_REQUEST_TIMEOUT,
+                    limits=_POOL_LIMITS,
+                    headers={"Connection": "keep-alive"},
+                )
+                atexit.register(_shared_http.close)
+    return _shared_http
+
+
+# ── On-disk cache ───────────────────────────────────────────────────
+
+
+def _cache_dir() -> str:
+    """Return the per-user cache directory for odoo_mcp."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "odoo_mcp")
+
+
+def _cache_key(*parts: str) -> str:
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+def _read_cache(path: str, ttl: float) -> Any:
+    """Return the cached value at ``path``, or None if missing or expired."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            entry = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if time.time() - entry.get("ts", 0) > ttl:
+        return None
+    return entry.get("value")
+
+
+def _make_private_dirs(path: str) -> None:
+    """Create ``path`` and any missing parents readable only by this user."""
+    parent = os.path.dirname(path)
+    if parent != path and not os.path.isdir(parent):
+        _make_private_dirs(parent)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+
+
+def _write_cache(path: str, value: Any) -> None:
+    """Atomically write ``value`` to ``path``; failures are only logged.
+
+    The file is created 0600 since it can hold Odoo project and user data.
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        _make_private_dirs(os.path.dirname(path))
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump({"ts": time.time(), "value": value}, fh)
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("Could not write cache file %s: %s", path, exc)
+
+
+def _delete_cache(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _prune_cache_dir(directory: str, ttl: float) -> None:
+    """Delete cache files in ``directory`` last written over ``ttl`` seconds ago."""
+    cutoff = time.time() - ttl
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _delete_cache_tree(root: str, path: str) -> None:
+    """Remove the directory ``path``, but only if it lies inside ``root``."""
+    root, path = os.path.realpath(root), os.path.realpath(path)
+    if os.path.commonpath([root, path]) != root:
+        logger.warning("Refusing to remove %s outside the cache at %s", path, root)
+        return
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _results_cache_dir(url: str, db: str, username: str) -> str:
+    return os.path.join(_cache_dir(), f"results-{_cache_key(url, db, username)}")
+
+
+def _tag_key(name: str) -> str:
+    return name.strip().lower()
+
+
+# Fields returned by the list helpers. Odoo sends every stored field when
+# none are named, which for project.task means well over a hundred.
+PROJECT_LIST_FIELDS = ["id", "name", "user_id", "task_count"]
+TASK_LIST_FIELDS = [
+    "id",
+    "name",
+    "stage_id",
+    "priority",
+    "user_ids",
+    "tag_ids",
+    "parent_id",
+    "date_deadline",
+]
+
 
 class OdooClient:
-    """Stateful wrapper around Odoo's XML-RPC endpoints."""
+    """Stateful wrapper around Odoo's JSON-RPC endpoint."""
 
     def __init__(
         self,
@@ -29,40 +228,104 @@ class OdooClient:
         self.username = username or os.environ.get("ODOO_USERNAME", "")
         self.api_key = api_key or os.environ.get("ODOO_API_KEY", "")
 
-        if not all([self.url, self.db, self.username, self.api_key]):
+        if not (self.url and self.db and self.username and self.api_key):
             raise ValueError(
                 "Missing Odoo connection details. Set ODOO_URL, ODOO_DB, "
                 "ODOO_USERNAME, and ODOO_API_KEY environment variables."
             )
 
-        self._common = xmlrpc.client.ServerProxy(
-            f"{self.url}/xmlrpc/2/common", allow_none=True
-        )
-        self._models = xmlrpc.client.ServerProxy(
-            f"{self.url}/xmlrpc/2/object", allow_none=True
-        )
+        self._http = _get_shared_http()
+        self._endpoint = f"{self.url}/jsonrpc"
         self._uid: int | None = None
+        self._uid_from_cache = False
+        self._server_version: str | None = None
         self._model_fields_cache: dict[str, set[str]] = {}
+        self._task_list_fields: list[str] | None = None
+        self._hours_field: Any = _UNRESOLVED
+        self._tag_ids: dict[str, int] = {}
+        self._tag_ids_since = time.monotonic()
+        self._tag_lock = threading.Lock()
+        self._result_cache: OrderedDict[tuple[str, str], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self._result_cache_lock = threading.Lock()
+        # Disk-backed queries this process has cached, mapped to their file.
+        # Only a query's first lookup may be served from the disk copy; the
+        # file of a query that falls out of this LRU is deleted so it can't
+        # be served again.
+        self._cached_keys: OrderedDict[tuple[str, str], str] = OrderedDict()
+        # Bumped by every invalidation so reads that overlapped a write
+        # don't cache what they fetched.
+        self._result_epoch = 0
+        self._results_cache_dir = _results_cache_dir(
+            self.url, self.db, self.username
+        )
+
+    # ── Transport ───────────────────────────────────────────────────
+
+    def _call(self, service: str, method: str, *args: Any) -> Any:
+        """POST a single JSON-RPC call to Odoo's /jsonrpc endpoint."""
+        return self._post(_rpc_payload(service, method, list(args)))
+
+    def _post(self, payload: dict[str, Any]) -> Any:
+        response = self._http.post(
+            self._endpoint, content=jsonutil.dump_bytes(payload), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+        return _rpc_result(jsonutil.loads(response.content))
 
     # ── Authentication ──────────────────────────────────────────────
 
+    def _uid_cache_path(self) -> str:
+        key = _cache_key(self.url, self.db, self.username)
+        return os.path.join(_cache_dir(), f"uid-{key}.json")
+
     @property
     def uid(self) -> int:
-        """Authenticate lazily and cache the uid."""
+        """Authenticate lazily and cache the uid, in memory and on disk."""
         if self._uid is None:
-            self._uid = self._common.authenticate(
-                self.db, self.username, self.api_key, {}
+            cached = _read_cache(self._uid_cache_path(), _UID_CACHE_TTL)
+            if cached:
+                self._uid = cached
+                self._uid_from_cache = True
+                return cached
+            uid = self._call(
+                "common", "authenticate", self.db, self.username, self.api_key, {}
             )
-            if not self._uid:
+            if not uid:
                 raise ConnectionError(
                     f"Odoo authentication failed for {self.username}@{self.url}"
                 )
+            self._uid = uid
+            _write_cache(self._uid_cache_path(), uid)
             logger.info("Authenticated as uid=%s on %s", self._uid, self.url)
         return self._uid
 
+    def authenticate(self) -> int:
+        """Check the credentials against the server, bypassing the cached uid."""
+        self._forget_uid()
+        return self.uid
+
+    def _forget_uid(self) -> None:
+        """Drop the cached uid so the next call re-authenticates."""
+        self._uid = None
+        self._uid_from_cache = False
+        _delete_cache(self._uid_cache_path())
+
     def version(self) -> dict:
         """Return the Odoo server version info."""
-        return self._common.version()
+        return self._call("common", "version")
+
+    def _get_server_version(self) -> str:
+        """Return the server version string, memoized in memory and on disk."""
+        if self._server_version is None:
+            path = os.path.join(_cache_dir(), f"version-{_cache_key(self.url)}.json")
+            server_version = _read_cache(path, _VERSION_CACHE_TTL)
+            if server_version is None:
+                server_version = str(self.version().get("server_version", ""))
+                _write_cache(path, server_version)
+            self._server_version = server_version
+        return self._server_version
 
     # ── Low-level execute_kw wrapper ────────────────────────────────
 
@@ -73,17 +336,70 @@ class OdooClient:
         args: list | None = None,
         kwargs: dict | None = None,
     ) -> Any:
-        """Call execute_kw on the Odoo object endpoint."""
-        return self._models.execute_kw(
-            self.db,
-            self.uid,
-            self.api_key,
-            model,
-            method,
-            args or [],
-            kwargs or {},
+        """Call execute_kw on the Odoo object service."""
+        if method not in _WRITE_METHODS:
+            return self._execute_reauth(model, method, args, kwargs)
+        # Drop cached lookups once the write has finished (or failed), so a
+        # read racing it can't leave the old rows cached.
+        try:
+            return self._execute_reauth(model, method, args, kwargs)
+        finally:
+            self._invalidate_results(model)
+            if model == "project.tags" and method != "create":
+                self._tag_ids.clear()  # renamed or deleted tags
+
+    def _execute_reauth(
+        self, model: str, method: str, args: list | None, kwargs: dict | None
+    ) -> Any:
+        try:
+            return self._execute_kw(model, method, args, kwargs)
+        except OdooRPCError as exc:
+            # A uid restored from disk may be stale; re-authenticate once.
+            if not (self._uid_from_cache and exc.name.endswith("AccessDenied")):
+                raise
+            logger.info("Cached uid rejected by %s; re-authenticating", self.url)
+            self._forget_uid()
+            return self._execute_kw(model, method, args, kwargs)
+
+    def _execute_kw(
+        self, model: str, method: str, args: list | None, kwargs: dict | None
+    ) -> Any:
+        # Build the argument list directly rather than going through _call's
+        # varargs packing; this is the path every helper funnels through.
+        # Read _uid first so only the very first call pays for the property.
+        return self._post(
+            _rpc_payload(
+                "object",
+                "execute_kw",
+                [
+                    self.db,
+                    self._uid or self.uid,
+                    self.api_key,
+                    model,
+                    method,
+                    args or [],
+                    kwargs or {},
+                ],
+            )
         )
 
+    def multicall(self, calls: list[tuple[str, str, list, dict]]) -> list[Any]:
+        """Run several execute_kw calls at once, returning results in order.
+
+        Each call is a ``(model, method, args, kwargs)`` tuple. Odoo's
+        /jsonrpc endpoint rejects JSON-RPC batch arrays, so the calls are
+        issued in parallel over the shared connection pool instead.
+        """
+        if not calls:
+            return []
+        self.uid  # authenticate once up front, not from every worker
+        workers = min(len(calls), _MAX_PARALLEL_CALLS)
+        execute = self.execute
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            submit = pool.submit
+            futures = [submit(execute, *call) for call in calls]
+            return [future.result() for future in futures]
+
     # ── Generic CRUD helpers ────────────────────────────────────────
 
     def search_read(
@@ -103,10 +419,135 @@ class OdooClient:
             kw["order"] = order
         return self.execute(model, "search_read", [domain or []], kw)
 
+    def iter_search_read(
+        self,
+        model: str,
+        domain: list | None = None,
+        fields: list[str] | None = None,
+        page_size: int = 200,
+        order: str | None = None,
+    ) -> Iterator[dict]:
+        """Yield matching records one at a time, fetching them page by page.
+
+        The next page is requested in the background while the caller
+        consumes the current one. Without an explicit ``order`` records are
+        paged by id so offsets stay stable.
+        """
+        order = order or "id asc"
+        offset = 0
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            page = self.search_read(model, domain, fields, page_size, offset, order)
+            while page:
+                offset += page_size
+                upcoming = None
+                if len(page) == page_size:
+                    upcoming = pool.submit(
+                        self.search_read,
+                        model,
+                        domain,
+                        fields,
+                        page_size,
+                        offset,
+                        order,
+                    )
+                yield from page
+                page = upcoming.result() if upcoming else []
+
+    def _cached_search_read(
+        self,
+        model: str,
+        domain: list | None = None,
+        fields: list[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str | None = None,
+        on_fetch: Callable[[list[dict]], None] | None = None,
+    ) -> list[dict]:
+        """``search_read`` served from a short-lived in-process LRU cache.
+
+        Only for read-mostly lookups; entries expire after
+        ``ODOO_MCP_CACHE_TTL`` seconds and are dropped whenever this client
+        writes to the model. For projects, stages, and tags, the first lookup
+        of a query in this process may be answered from an on-disk copy up
+        to ``ODOO_MCP_DISK_CACHE_TTL`` seconds old, so a restarted server
+        does not have to refetch them; after that only the in-memory TTL
+        applies. ``on_fetch`` is called with rows freshly fetched from Odoo.
+        """
+        if _RESULT_CACHE_TTL <= 0:
+            return self.search_read(model, domain, fields, limit, offset, order)
+        key = (model, jsonutil.dumps([domain, fields, limit, offset, order]))
+        persist = _DISK_RESULT_TTL > 0 and model in _DISK_RESULT_MODELS
+        cache = self._result_cache
+        with self._result_cache_lock:
+            hit = cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < _RESULT_CACHE_TTL:
+                cache.move_to_end(key)
+                return hit[1]
+            cold = persist and key not in self._cached_keys
+            epoch = self._result_epoch
+        path = ""
+        if persist:
+            path = os.path.join(
+                self._model_cache_dir(model), f"{_cache_key(key[1])}.json"
+            )
+        rows = _read_cache(path, _DISK_RESULT_TTL) if cold else None
+        fetched = rows is None
+        if fetched:
+            rows = self.search_read(model, domain, fields, limit, offset, order)
+        with self._result_cache_lock:
+            if self._result_epoch != epoch:
+                return rows  # a write finished meanwhile; rows may predate it
+            if persist:
+                if fetched:
+                    _write_cache(path, rows)
+                self._cached_keys[key] = path
+                self._cached_keys.move_to_end(key)
+                while len(self._cached_keys) > _RESULT_CACHE_SIZE:
+                    _delete_cache(self._cached_keys.popitem(last=False)[1])
+            cache[key] = (time.monotonic(), rows)
+            cache.move_to_end(key)
+            while len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        if fetched and persist:
+            _prune_cache_dir(os.path.dirname(path), _DISK_RESULT_TTL)
+        if fetched and on_fetch is not None:
+            on_fetch(rows)
+        return rows
+
+    def invalidate(self, model: str | None = None) -> None:
+        """Drop cached lookups for ``model``, or for every model."""
+        if model in (None, "project.tags"):
+            self._tag_ids.clear()
+        self._invalidate_results(model)
+
+    def _invalidate_results(self, model: str | None) -> None:
+        with self._result_cache_lock:
+            self._result_epoch += 1
+            if model is None:
+                self._result_cache.clear()
+                _delete_cache_tree(self._results_cache_dir, self._results_cache_dir)
+                return
+            models = {model, *_CACHE_DEPENDENTS.get(model, ())}
+            for key in [k for k in self._result_cache if k[0] in models]:
+                del self._result_cache[key]
+            for name in models:
+                _delete_cache_tree(self._results_cache_dir, self._model_cache_dir(name))
+
+    def _model_cache_dir(self, model: str) -> str:
+        # Model names come from tool arguments; hashing keeps them from
+        # naming a path outside the cache.
+        return os.path.join(self._results_cache_dir, _cache_key(model))
+
     def create(self, model: str, values: dict) -> int:
         """Create a single record, returning its ID."""
         return self.execute(model, "create", [values])
 
+    def create_many(self, model: str, vals_list: list[dict]) -> list[int]:
+        """Create several records in one call, returning their IDs in order."""
+        if not vals_list:
+            return []
+        return self.execute(model, "create", [vals_list])
+
     def write(self, model: str, record_ids: list[int], values: dict) -> bool:
         """Update one or more records."""
         return self.execute(model, "write", [record_ids, values])
@@ -125,50 +566,109 @@ class OdooClient:
         return self.execute(model, "read", [record_ids], kw)
 
     def get_model_fields(self, model: str) -> set[str]:
-        """Return available field names for a model (cached)."""
+        """Return available field names for a model (cached).
+
+        The names are also persisted on disk, keyed by server version, so a
+        fresh process can skip the ``fields_get`` round trip.
+        """
         cached = self._model_fields_cache.get(model)
         if cached is not None:
             return cached
-        fields_meta = self.execute(model, "fields_get", [], {})
-        field_names = set(fields_meta.keys())
+        key = _cache_key(self.url, self.db, model, self._get_server_version())
+        path = os.path.join(_cache_dir(), "fields", f"{key}.json")
+        names = _read_cache(path, _FIELDS_CACHE_TTL)
+        if names is None:
+            fields_meta = self.execute(
+                model, "fields_get", [], {"attributes": ["type"]}
+            )
+            names = list(fields_meta.keys())
+            _write_cache(path, names)
+        field_names = set(names)
         self._model_fields_cache[model] = field_names
         return field_names
 
     def _task_hours_field(self) -> str | None:
         """Return the preferred task estimate field for this Odoo instance."""
-        fields = self.get_model_fields("project.task")
-        if "planned_hours" in fields:
-            return "planned_hours"
-        if "allocated_hours" in fields:
-            return "allocated_hours"
-        return None
+        if self._hours_field is _UNRESOLVED:
+            fields = self.get_model_fields("project.task")
+            if "planned_hours" in fields:
+                self._hours_field = "planned_hours"
+            elif "allocated_hours" in fields:
+                self._hours_field = "allocated_hours"
+            else:
+                self._hours_field = None
+        return self._hours_field
 
     # ── Project helpers ─────────────────────────────────────────────
 
-    def list_projects(self, active_only: bool = True) -> list[dict]:
-        """List projects with key metadata."""
+    def list_projects(
+        self,
+        active_only: bool = True,
+        order: str | None = "name asc",
+        fields: list[str] = PROJECT_LIST_FIELDS,
+    ) -> list[dict]:
+        """List projects with key metadata.
+
+        Pass ``order=None`` when the caller does not need sorted results to
+        let Odoo skip the sort.
+        """
         domain: list = []
         if active_only:
             domain.append(["active", "=", True])
-        return self.search_read(
-            "project.project",
-            domain=domain,
-            fields=["id", "name", "user_id", "partner_id", "tag_ids", "task_count"],
-            order="name asc",
+        return self._cached_search_read(
+            "project.project", domain=domain, fields=fields, order=order
         )
 
+    def bootstrap(self, active_only: bool = True) -> tuple[int, dict, list[dict]]:
+        """Return ``(uid, version info, projects)`` with overlapping calls.
+
+        Meant for connection checks, so it always authenticates and lists
+        projects live rather than trusting the cached uid or lookups. The
+        version request runs alongside, so this costs two round trips
+        instead of three. Projects are returned unsorted.
+        """
+        domain: list = [["active", "=", True]] if active_only else []
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            version = pool.submit(self.version)
+            uid = self.authenticate()
+            projects = self.search_read(
+                "project.project", domain=domain, fields=PROJECT_LIST_FIELDS
+            )
+            return uid, version.result(), projects
+
     def get_project_stages(self, project_id: int) -> list[dict]:
         """Return the task stages (kanban columns) for a project."""
-        return self.search_read(
+        return self._cached_search_read(
             "project.task.type",
             domain=[["project_ids", "in", [project_id]]],
             fields=["id", "name", "sequence", "fold"],
             order="sequence asc",
         )
 
+    def get_project_stages_bulk(self, project_ids: list[int]) -> dict[int, list[dict]]:
+        """Return the stages of several projects in one round trip.
+
+        Maps each project ID to its stages, ordered by sequence.
+        """
+        if not project_ids:
+            return {}
+        rows = self._cached_search_read(
+            "project.task.type",
+            domain=[["project_ids", "in", project_ids]],
+            fields=["id", "name", "sequence", "fold", "project_ids"],
+            limit=0,  # Odoo treats 0 as "no limit"
+            order="sequence asc",
+        )
+        stages: dict[int, list[dict]] = {pid: [] for pid in project_ids}
+        for row in rows:
+            for pid in row["project_ids"]:
+                if pid in stages:
+                    stages[pid].append(row)
+        return stages
+
     # ── Task helpers ────────────────────────────────────────────────
 
-    def create_task(
+    def build_task_values(
         self,
         project_id: int,
         name: str,
@@ -179,8 +679,8 @@ class OdooClient:
         user_ids: list[int] | None = None,
         parent_id: int | None = None,
         planned_hours: float | None = None,
-    ) -> int:
-        """Create a project task and return its ID."""
+    ) -> dict[str, Any]:
+        """Return the ``project.task`` values for a new task."""
         vals: dict[str, Any] = {
             "name": name,
             "project_id": project_id,
@@ -200,6 +700,32 @@ class OdooClient:
             vals["tag_ids"] = [(6, 0, tag_ids)]
         if user_ids:
             vals["user_ids"] = [(6, 0, user_ids)]
+        return vals
+
+    def create_task(
+        self,
+        project_id: int,
+        name: str,
+        description: str = "",
+        priority: str = "0",
+        stage_id: int | None = None,
+        tag_ids: list[int] | None = None,
+        user_ids: list[int] | None = None,
+        parent_id: int | None = None,
+        planned_hours: float | None = None,
+    ) -> int:
+        """Create a project task and return its ID."""
+        vals = self.build_task_values(
+            project_id,
+            name,
+            description=description,
+            priority=priority,
+            stage_id=stage_id,
+            tag_ids=tag_ids,
+            user_ids=user_ids,
+            parent_id=parent_id,
+            planned_hours=planned_hours,
+        )
         return self.create("project.task", vals)
 
     def list_tasks(
@@ -207,35 +733,35 @@ class OdooClient:
         project_id: int,
         stage_id: int | None = None,
         limit: int = 100,
+        fields: list[str] | None = None,
     ) -> list[dict]:
-        """List tasks in a project, optionally filtered by stage."""
+        """List tasks in a project, optionally filtered by stage.
+
+        ``fields`` defaults to :data:`TASK_LIST_FIELDS` plus the task's hours
+        field, limited to the fields this server has.
+        """
         domain: list = [["project_id", "=", project_id]]
         if stage_id:
             domain.append(["stage_id", "=", stage_id])
-        task_fields = self.get_model_fields("project.task")
-        fields = [
-            "id",
-            "name",
-            "stage_id",
-            "priority",
-            "user_ids",
-            "tag_ids",
-            "parent_id",
-            "child_ids",
-            "date_deadline",
-        ]
-        hours_field = self._task_hours_field()
-        if hours_field:
-            fields.append(hours_field)
-
         return self.search_read(
             "project.task",
             domain=domain,
-            fields=[f for f in fields if f in task_fields],
+            fields=fields or self._get_task_list_fields(),
             limit=limit,
             order="sequence asc, id asc",
         )
 
+    def _get_task_list_fields(self) -> list[str]:
+        """Return the task fields to list, filtered to those this server has."""
+        if self._task_list_fields is None:
+            task_fields = self.get_model_fields("project.task")
+            fields = list(TASK_LIST_FIELDS)
+            hours_field = self._task_hours_field()
+            if hours_field:
+                fields.append(hours_field)
+            self._task_list_fields = [f for f in fields if f in task_fields]
+        return self._task_list_fields
+
     def update_task(self, task_id: int, values: dict) -> bool:
         """Update a task by ID."""
         if "planned_hours" in values:
@@ -267,41 +793,115 @@ class OdooClient:
     # ── Tag helpers ─────────────────────────────────────────────────
 
     def find_or_create_tags(self, tag_names: list[str]) -> list[int]:
-        """Resolve tag names to IDs, creating any that don't exist."""
+        """Resolve tag names to IDs, creating any that don't exist.
+
+        Resolved names are remembered (case-insensitively, ignoring
+        surrounding whitespace) for ``ODOO_MCP_CACHE_TTL`` seconds and seeded
+        by :meth:`list_tags`, so known tags cost no round trip.
+        """
         if not tag_names:
             return []
 
-        existing = self.search_read(
+        keys = [_tag_key(name) for name in tag_names]
+        use_memo = _RESULT_CACHE_TTL > 0
+        if use_memo:
+            memo = self._tag_memo()
+            cached = [memo.get(key) for key in keys]
+            if None not in cached:
+                return cached
+
+        # Resolve misses one caller at a time so concurrent tool calls don't
+        # both create the same tag.
+        with self._tag_lock:
+            known = self._tag_memo() if use_memo else {}
+            ids = {key: known.get(key) for key in keys}
+            lookup: dict[str, str] = {}
+            for key, name in zip(keys, tag_names):
+                if ids[key] is None:
+                    lookup.setdefault(key, name.strip())
+            if not lookup:
+                return [ids[key] for key in keys]
+
+            existing = self.search_read(
+                "project.tags",
+                domain=[["name", "in", list(lookup.values())]],
+                fields=["id", "name"],
+                limit=len(lookup),
+            )
+            resolved = {_tag_key(t["name"]): t["id"] for t in existing}
+
+            # Create every missing tag in a single multi-record call
+            missing = {k: n for k, n in lookup.items() if k not in resolved}
+            if missing:
+                new_ids = self.create_many(
+                    "project.tags", [{"name": n} for n in missing.values()]
+                )
+                resolved.update(zip(missing, new_ids))
+
+            known.update(resolved)
+            ids.update(resolved)
+            return [ids[key] for key in keys]
+
+    def forget_missing_tags(self, tag_ids: list[int]) -> bool:
+        """Clear the tag memo if any of ``tag_ids`` no longer exists in Odoo.
+
+        Call this when a write using resolved tags fails. Returns True when a
+        tag was deleted behind the memo's back, meaning the names should be
+        resolved again and the write retried.
+        """
+        unique_ids = list(set(tag_ids))
+        if not unique_ids:
+            return False
+        found = self.search_read(
             "project.tags",
-            domain=[["name", "in", tag_names]],
-            fields=["id", "name"],
+            domain=[["id", "in", unique_ids]],
+            fields=["id"],
+            limit=len(unique_ids),
+        )
+        if len(found) == len(unique_ids):
+            return False
+        logger.info("Tag memo is stale; resolving tag names again")
+        self.invalidate("project.tags")
+        return True
+
+    def _tag_memo(self) -> dict[str, int]:
+        """Return the tag name memo, emptied once it is older than the TTL."""
+        if time.monotonic() - self._tag_ids_since > _RESULT_CACHE_TTL:
+            self._tag_ids = {}
+            self._tag_ids_since = time.monotonic()
+        return self._tag_ids
+
+    def _seed_tag_memo(self, tags: list[dict]) -> None:
+        with self._tag_lock:
+            self._tag_ids = {_tag_key(t["name"]): t["id"] for t in tags}
+            self._tag_ids_since = time.monotonic()
+
+    def list_tags(self) -> list[dict]:
+        """List all project tags; fresh listings also rebuild the tag memo."""
+        return self._cached_search_read(
+            "project.tags",
+            fields=["id", "name", "color"],
+            limit=0,
+            order="name asc",
+            on_fetch=self._seed_tag_memo,
         )
-        existing_map = {t["name"].lower(): t["id"] for t in existing}
-
-        tag_ids = []
-        for name in tag_names:
-            tid = existing_map.get(name.lower())
-            if tid:
-                tag_ids.append(tid)
-            else:
-                tid = self.create("project.tags", {"name": name})
-                tag_ids.append(tid)
-        return tag_ids
 
     # ── User helpers ────────────────────────────────────────────────
 
-    def search_users(self, query: str = "", limit: int = 20) -> list[dict]:
-        """Search internal users by name or email."""
+    def search_users(self, query: str = "", limit: int = 50) -> list[dict]:
+        """Search internal users by name, email, or login."""
         domain: list = [["share", "=", False]]
         if query:
             domain = [
                 "&",
                 ["share", "=", False],
                 "|",
+                "|",
                 ["name", "ilike", query],
                 ["email", "ilike", query],
+                ["login", "ilike", query],
             ]
-        return self.search_read(
+        return self._cached_search_read(
             "res.users",
             domain=domain,
             fields=["id", "name", "email"],
@@ -309,6 +909,17 @@ class OdooClient:
             order="name asc",
         )
 
+    # ── Milestone helpers ───────────────────────────────────────────
+
+    def list_milestones(self, project_id: int) -> list[dict]:
+        """List the milestones of a project, soonest deadline first."""
+        return self._cached_search_read(
+            "project.milestone",
+            domain=[["project_id", "=", project_id]],
+            fields=["id", "name", "deadline", "is_reached"],
+            order="deadline asc, id asc",
+        )
+
     # ── Project helpers (extended) ─────────────────────────────────
 
     def create_project(self, values: dict[str, Any]) -> int:
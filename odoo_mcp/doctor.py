@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import os
 import sys
-from urllib.parse import urlparse
+from typing import Callable
+from urllib.parse import ParseResult, urlparse
 
+from odoo_mcp import jsonutil
 from odoo_mcp.client import OdooClient
 
 
@@ -16,14 +17,21 @@ def _mask_secret(value: str) -> str:
     return f"{value[:4]}...{value[-4:]}"
 
 
+_URL_CHECKS: tuple[tuple[Callable[[ParseResult], bool], str], ...] = (
+    (
+        lambda p: not p.scheme or not p.netloc,
+        "ODOO_URL should be a full URL like https://company.odoo.com",
+    ),
+    (
+        lambda p: "/odoo" in p.path,
+        "ODOO_URL should be the base host; remove '/odoo' from the URL",
+    ),
+)
+
+
 def _validate_url(url: str) -> list[str]:
-    warnings: list[str] = []
     parsed = urlparse(url)
-    if not parsed.scheme or not parsed.netloc:
-        warnings.append("ODOO_URL should be a full URL like https://company.odoo.com")
-    if "/odoo" in parsed.path:
-        warnings.append("ODOO_URL should be the base host; remove '/odoo' from the URL")
-    return warnings
+    return [message for check, message in _URL_CHECKS if check(parsed)]
 
 
 def main() -> None:
@@ -31,19 +39,19 @@ def main() -> None:
     env = {k: os.environ.get(k, "") for k in required}
     missing = [k for k, v in env.items() if not v]
 
+    api_key = env["ODOO_API_KEY"]
+
     print("Odoo MCP Doctor")
     print("=" * 60)
     print(
-        json.dumps(
+        jsonutil.dumps(
             {
                 "ODOO_URL": env["ODOO_URL"],
                 "ODOO_DB": env["ODOO_DB"],
                 "ODOO_USERNAME": env["ODOO_USERNAME"],
-                "ODOO_API_KEY": _mask_secret(env["ODOO_API_KEY"])
-                if env["ODOO_API_KEY"]
-                else "",
+                "ODOO_API_KEY": _mask_secret(api_key) if api_key else "",
             },
-            indent=2,
+            indent=True,
         )
     )
 
@@ -59,16 +67,15 @@ def main() -> None:
 
     try:
         client = OdooClient()
-        version = client.version()
-        projects = client.list_projects(active_only=True)
+        uid, version, projects = client.bootstrap(active_only=True)
         output = {
             "status": "connected",
-            "uid": client.uid,
+            "uid": uid,
             "server_version": version.get("server_version"),
             "active_projects": len(projects),
         }
         print("\nConnection Check:")
-        print(json.dumps(output, indent=2))
+        print(jsonutil.dumps(output, indent=True))
     except Exception as exc:  # noqa: BLE001 - doctor should catch and explain all failures
         print("\nERROR: Connection check failed")
         print(f"{type(exc).__name__}: {exc}")
@@ -0,0 +1,68 @@
+"""JSON encoding helpers.
+
+Uses ``orjson`` when it is installed (``pip install odoo-mcp[fast]``) and
+falls back to the standard library otherwise.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+from decimal import Decimal
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(
+    obj: Any, indent: bool = False, default: Callable[[Any], Any] | None = None
+) -> str:
+    """Serialize ``obj`` to a JSON string, optionally indented by two spaces.
+
+    ``default`` is called for objects JSON can't represent natively. With
+    orjson it also receives datetimes, so both backends format them alike.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option).decode()
+    if indent:
+        return json.dumps(obj, indent=2, default=default)
+    return json.dumps(obj, separators=(",", ":"), default=default)
+
+
+def odoo_default(obj: Any) -> Any:
+    """``default`` hook that encodes values the way Odoo's JSON-RPC does.
+
+    Datetimes use Odoo's ``YYYY-MM-DD HH:MM:SS`` format, decimals become
+    floats and sets become lists; anything else falls back to ``str``.
+    """
+    if isinstance(obj, datetime.datetime):
+        return obj.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def dump_bytes(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 encoded JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
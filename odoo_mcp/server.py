@@ -9,15 +9,21 @@ Run directly:  python -m odoo_mcp.server
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import graphlib
 import logging
 import os
 import sys
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.transport_security import TransportSecuritySettings
 
-from odoo_mcp.client import OdooClient
+from odoo_mcp import jsonutil
+from odoo_mcp.client import OdooClient, OdooRPCError
 
 # ── Logging ─────────────────────────────────────────────────────────
 
@@ -27,6 +33,9 @@ logging.basicConfig(
     stream=sys.stderr,
 )
 logger = logging.getLogger("odoo_mcp")
+# httpx logs every request at INFO; only surface that with LOG_LEVEL=DEBUG.
+if logging.getLogger().level > logging.DEBUG:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # ── MCP app ─────────────────────────────────────────────────────────
 
@@ -36,20 +45,32 @@ mcp = FastMCP(
         "Odoo Project Management MCP server. Use these tools to create and "
         "manage tasks in Odoo. A typical workflow: list_projects → "
         "get_project_stages → create tasks (with parent_id for subtasks). "
-        "When turning a PRD into tasks, create parent tasks as epics first, "
-        "then create subtasks under them using parent_id."
+        "When turning a PRD into tasks, create the epics and their subtasks "
+        "in one create_tasks_batch call, linking subtasks with ref/parent_ref."
     ),
 )
 
 # Lazy-initialized client (created on first tool call)
 _client: OdooClient | None = None
+_client_lock = threading.Lock()
+
+# OdooClient is blocking, so tools hand its calls to this pool to keep the
+# event loop free and let independent requests overlap.
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="odoo-rpc")
+
+# odoo_create_tasks_batch creates tasks in chunks so progress can be
+# reported as they land, with a few chunks in flight at once.
+_BATCH_CHUNK_SIZE = 10
+_MAX_CONCURRENT = max(1, int(os.environ.get("ODOO_MCP_MAX_CONCURRENT", "4")))
 
 
 def get_client() -> OdooClient:
     """Return (and lazily create) the Odoo client singleton."""
     global _client
     if _client is None:
-        _client = OdooClient()
+        with _client_lock:
+            if _client is None:
+                _client = OdooClient()
     return _client
 
 
@@ -57,8 +78,136 @@ def get_client() -> OdooClient:
 
 
 def _fmt(obj: Any) -> str:
-    """Pretty-format a result for the LLM."""
-    return json.dumps(obj, indent=2, default=str)
+    """Format a result for the LLM as compact JSON."""
+    return jsonutil.dumps(obj, default=jsonutil.odoo_default)
+
+
+async def _run(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking client call on the RPC worker pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _executor, functools.partial(fn, *args, **kwargs)
+    )
+
+
+async def _refresh_stale_tags(
+    tag_names: list[str], tag_ids: list[int]
+) -> list[int] | None:
+    """Resolve ``tag_names`` again if a write using ``tag_ids`` hit a dead tag.
+
+    Returns the fresh IDs, or None when every tag still exists and the write
+    failed for some other reason.
+    """
+    client = get_client()
+    if not tag_ids or not await _run(client.forget_missing_tags, tag_ids):
+        return None
+    return await _run(client.find_or_create_tags, tag_names)
+
+
+_PendingTask = tuple[dict[str, Any], "asyncio.Future[int]"]
+
+
+class _TaskCreateBuffer:
+    """Combine concurrent single-task creates into multi-record creates.
+
+    Tasks queue while a create is in flight and are then written together with
+    one ``create_many``, so a burst of odoo_create_task calls costs a few
+    round trips instead of one each. On an idle server a task is written
+    straight away.
+    """
+
+    def __init__(self, max_batch: int = 32) -> None:
+        self._max_batch = max_batch
+        self._pending: list[_PendingTask] = []
+        self._flusher: asyncio.Task[None] | None = None
+
+    async def create(self, vals: dict[str, Any]) -> int:
+        """Queue ``vals`` for creation and return the new task's ID."""
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._pending.append((vals, future))
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        try:
+            while self._pending:
+                batch = self._pending[: self._max_batch]
+                del self._pending[: self._max_batch]
+                await self._write(batch)
+        finally:
+            self._flusher = None
+
+    async def _write(self, batch: list[_PendingTask]) -> None:
+        client = get_client()
+        vals_list = [vals for vals, _ in batch]
+        outcomes: list[Any]
+        try:
+            outcomes = await _run(client.create_many, "project.task", vals_list)
+        except OdooRPCError as exc:
+            if len(batch) == 1:
+                outcomes = [exc]
+            else:
+                # Odoo rejected the create and rolled it back, so one bad task
+                # fails them all; retry one by one so only its caller errors.
+                outcomes = await asyncio.gather(
+                    *(_run(client.create, "project.task", vals) for vals in vals_list),
+                    return_exceptions=True,
+                )
+        except Exception as exc:  # noqa: BLE001 - handed to the waiting callers
+            # A transport error says nothing about whether Odoo committed the
+            # rows, so retrying could create every task twice.
+            outcomes = [exc] * len(batch)
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():  # the caller went away
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+_task_writes = _TaskCreateBuffer()
+
+
+def _task_levels(task_defs: list[dict]) -> tuple[list[list[int]], dict[int, int]]:
+    """Group batch task definitions into creation levels by ``parent_ref``.
+
+    Pops ``ref`` and ``parent_ref`` from each definition. Returns the levels as
+    lists of indexes, parents before children, and a child-to-parent map.
+    """
+    refs: dict[str, int] = {}
+    for index, task_def in enumerate(task_defs):
+        ref = task_def.pop("ref", None)
+        if ref is None:
+            continue
+        if ref in refs:
+            raise ValueError(f"Duplicate task ref {ref!r}")
+        refs[ref] = index
+
+    parents: dict[int, int] = {}
+    for index, task_def in enumerate(task_defs):
+        parent_ref = task_def.pop("parent_ref", None)
+        if parent_ref is None:
+            continue
+        if parent_ref not in refs:
+            raise ValueError(f"Unknown parent_ref {parent_ref!r}")
+        parents[index] = refs[parent_ref]
+
+    sorter: graphlib.TopologicalSorter[int] = graphlib.TopologicalSorter()
+    for index in range(len(task_defs)):
+        sorter.add(index, *([parents[index]] if index in parents else []))
+    try:
+        sorter.prepare()
+    except graphlib.CycleError as exc:
+        names = [task_defs[index].get("name") for index in exc.args[1]]
+        raise ValueError(f"parent_ref cycle between tasks {names}") from exc
+    levels = []
+    while sorter.is_active():
+        level = sorted(sorter.get_ready())
+        levels.append(level)
+        sorter.done(*level)
+    return levels, parents
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -70,15 +219,17 @@ def _fmt(obj: Any) -> str:
 
 
 @mcp.tool()
-def odoo_test_connection() -> str:
+async def odoo_test_connection() -> str:
     """Test the Odoo connection and return server version info.
 
     Call this first to verify credentials are working.
     """
     client = get_client()
-    version = client.version()
-    # Also trigger auth to validate credentials
-    uid = client.uid
+    # Independent round trips; authenticate skips the cached uid so the
+    # credentials are actually checked.
+    version, uid = await asyncio.gather(
+        _run(client.version), _run(client.authenticate)
+    )
     return _fmt(
         {
             "status": "connected",
@@ -89,11 +240,28 @@ def odoo_test_connection() -> str:
     )
 
 
+@mcp.tool()
+async def odoo_cache_invalidate(model: str | None = None) -> str:
+    """Drop cached lookups so the next call reads fresh data from Odoo.
+
+    Projects, stages, tags, users, and milestones are cached in memory, and
+    projects, stages, and tags on disk as well. Writes made through this
+    server refresh the cache automatically; call this after changing data
+    directly in Odoo.
+
+    Args:
+        model: Odoo model to refresh (e.g. 'project.tags'). Omit to clear
+               every cached lookup.
+    """
+    await _run(get_client().invalidate, model)
+    return _fmt({"invalidated": model or "all"})
+
+
 # ── Projects ────────────────────────────────────────────────────────
 
 
 @mcp.tool()
-def odoo_list_projects(active_only: bool = True) -> str:
+async def odoo_list_projects(active_only: bool = True) -> str:
     """List all projects in Odoo.
 
     Returns project id, name, manager, and task count.
@@ -102,12 +270,12 @@ def odoo_list_projects(active_only: bool = True) -> str:
     Args:
         active_only: Only return active (non-archived) projects. Default True.
     """
-    projects = get_client().list_projects(active_only=active_only)
+    projects = await _run(get_client().list_projects, active_only=active_only)
     return _fmt(projects)
 
 
 @mcp.tool()
-def odoo_create_project(
+async def odoo_create_project(
     name: str,
     description: str = "",
     manager_user_id: int | None = None,
@@ -127,12 +295,12 @@ def odoo_create_project(
     if manager_user_id is not None:
         vals["user_id"] = manager_user_id
 
-    project_id = get_client().create_project(vals)
+    project_id = await _run(get_client().create_project, vals)
     return _fmt({"id": project_id, "name": name, "active": active})
 
 
 @mcp.tool()
-def odoo_update_project(
+async def odoo_update_project(
     project_id: int,
     name: str | None = None,
     description: str | None = None,
@@ -163,14 +331,14 @@ def odoo_update_project(
     if not vals:
         return _fmt({"error": "No fields provided to update"})
 
-    get_client().update_project(project_id, vals)
+    await _run(get_client().update_project, project_id, vals)
     return _fmt(
         {"updated": True, "project_id": project_id, "fields_changed": list(vals.keys())}
     )
 
 
 @mcp.tool()
-def odoo_get_project_stages(project_id: int) -> str:
+async def odoo_get_project_stages(project_id: int) -> str:
     """Get the kanban stages (columns) for a project.
 
     Returns stage id, name, and sequence order.
@@ -179,7 +347,7 @@ def odoo_get_project_stages(project_id: int) -> str:
     Args:
         project_id: The Odoo project ID.
     """
-    stages = get_client().get_project_stages(project_id)
+    stages = await _run(get_client().get_project_stages, project_id)
     return _fmt(stages)
 
 
@@ -187,7 +355,7 @@ def odoo_get_project_stages(project_id: int) -> str:
 
 
 @mcp.tool()
-def odoo_create_task(
+async def odoo_create_task(
     project_id: int,
     name: str,
     description: str = "",
@@ -220,9 +388,10 @@ def odoo_create_task(
     # Resolve tag names to IDs
     tag_ids = None
     if tag_names:
-        tag_ids = client.find_or_create_tags(tag_names)
+        tag_ids = await _run(client.find_or_create_tags, tag_names)
 
-    task_id = client.create_task(
+    vals = await _run(
+        client.build_task_values,
         project_id=project_id,
         name=name,
         description=description,
@@ -233,20 +402,36 @@ def odoo_create_task(
         parent_id=parent_id,
         planned_hours=planned_hours,
     )
+    try:
+        task_id = await _task_writes.create(vals)
+    except OdooRPCError:
+        # A remembered tag may have been deleted in Odoo; retry once
+        fresh_ids = await _refresh_stale_tags(tag_names or [], tag_ids or [])
+        if fresh_ids is None:
+            raise
+        vals["tag_ids"] = [(6, 0, fresh_ids)]
+        task_id = await _task_writes.create(vals)
 
     return _fmt({"id": task_id, "name": name, "project_id": project_id})
 
 
 @mcp.tool()
-def odoo_create_tasks_batch(
+async def odoo_create_tasks_batch(
     project_id: int,
     tasks: list[dict],
+    ctx: Context,
 ) -> str:
     """Create multiple tasks in a project at once.
 
     This is the primary tool for turning a PRD into actionable items. Pass a
-    list of task definitions. To create a hierarchy, first create parent tasks,
-    note their returned IDs, then create subtasks referencing parent_id.
+    list of task definitions. To create a hierarchy in the same call, give
+    parent tasks a "ref" and point subtasks at it with "parent_ref"; parents
+    are created first and their IDs filled in for the subtasks.
+
+    Tasks are created in multi-record chunks and progress is reported as
+    each chunk lands. A task definition with unknown keys, or a chunk Odoo
+    rejects, is reported with an "error" entry without stopping the rest;
+    subtasks of a task that failed are skipped with an error.
 
     Each task dict supports these keys:
         - name (required): Task title
@@ -255,7 +440,9 @@ def odoo_create_tasks_batch(
         - stage_id: Kanban stage ID
         - tag_names: List of tag name strings
         - user_ids: List of assignee user IDs
-        - parent_id: Parent task ID for subtasks
+        - parent_id: Parent task ID for subtasks of an existing task
+        - ref: Label other tasks in this batch can use as parent_ref
+        - parent_ref: The ref of the parent task in this batch
         - planned_hours: Estimated hours
 
     Args:
@@ -263,29 +450,113 @@ def odoo_create_tasks_batch(
         tasks: List of task definition dicts.
 
     Returns:
-        List of created task objects with their IDs.
+        List of created task objects with their IDs, in input order.
     """
     client = get_client()
-    results = []
-
-    for task_def in tasks:
-        tag_names = task_def.pop("tag_names", None)
-        tag_ids = None
-        if tag_names:
-            tag_ids = client.find_or_create_tags(tag_names)
-
-        task_id = client.create_task(
-            project_id=project_id,
-            tag_ids=tag_ids,
-            **task_def,
-        )
-        results.append({"id": task_id, "name": task_def["name"]})
-
-    return _fmt({"created": len(results), "tasks": results})
+    task_defs = [dict(task_def) for task_def in tasks]
+    task_tags = [task_def.pop("tag_names", None) or [] for task_def in task_defs]
+    levels, parents = _task_levels(task_defs)
+
+    # Resolve every tag once up front instead of once per task
+    unique_tags = list(dict.fromkeys(name for names in task_tags for name in names))
+    tag_map: dict[str, int] = {}
+    if unique_tags:
+        tag_ids = await _run(client.find_or_create_tags, unique_tags)
+        tag_map = dict(zip(unique_tags, tag_ids))
+
+    results: list[dict[str, Any]] = [{} for _ in task_defs]
+    task_ids: dict[int, int] = {}
+
+    # Build a level's task values locally, then create them in chunks
+    def build_vals(level: list[int]) -> tuple[list[int], list[dict]]:
+        indexes = []
+        vals_list = []
+        for index in level:
+            task_def = task_defs[index]
+            if index in parents:
+                parent_id = task_ids.get(parents[index])
+                if parent_id is None:
+                    results[index] = {
+                        "name": task_def.get("name"),
+                        "error": "Parent task was not created",
+                    }
+                    continue
+                task_def["parent_id"] = parent_id
+            try:
+                vals = client.build_task_values(
+                    project_id=project_id,
+                    tag_ids=[tag_map[name] for name in task_tags[index]] or None,
+                    **task_def,
+                )
+            except TypeError as exc:
+                results[index] = {"name": task_def.get("name"), "error": str(exc)}
+                continue
+            indexes.append(index)
+            vals_list.append(vals)
+            results[index] = {"id": None, "name": task_def["name"]}
+        return indexes, vals_list
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT)
+
+    async def refresh_chunk_tags(chunk_indexes: list[int], chunk: list[dict]) -> bool:
+        names = list(dict.fromkeys(n for i in chunk_indexes for n in task_tags[i]))
+        fresh_ids = await _refresh_stale_tags(names, [tag_map[n] for n in names])
+        if fresh_ids is None:
+            return False
+        tag_map.update(zip(names, fresh_ids))
+        for index, vals in zip(chunk_indexes, chunk):
+            if task_tags[index]:
+                vals["tag_ids"] = [(6, 0, [tag_map[n] for n in task_tags[index]])]
+        return True
+
+    async def create_chunk(
+        indexes: list[int], vals_list: list[dict], start: int
+    ) -> tuple[int, list[int] | Exception]:
+        chunk_indexes = indexes[start : start + _BATCH_CHUNK_SIZE]
+        chunk = vals_list[start : start + _BATCH_CHUNK_SIZE]
+        async with semaphore:
+            try:
+                try:
+                    return start, await _run(client.create_many, "project.task", chunk)
+                except OdooRPCError:
+                    # A remembered tag may have been deleted in Odoo; retry once
+                    if not await refresh_chunk_tags(chunk_indexes, chunk):
+                        raise
+                return start, await _run(client.create_many, "project.task", chunk)
+            except Exception as exc:  # noqa: BLE001 - reported per task below
+                return start, exc
+
+    total = len(task_defs)
+    done = 0
+    created = 0
+    for level in levels:
+        indexes, vals_list = await _run(build_vals, level)
+        done += len(level) - len(indexes)
+        chunks = [
+            create_chunk(indexes, vals_list, start)
+            for start in range(0, len(vals_list), _BATCH_CHUNK_SIZE)
+        ]
+        for next_chunk in asyncio.as_completed(chunks):
+            start, outcome = await next_chunk
+            chunk_indexes = indexes[start : start + _BATCH_CHUNK_SIZE]
+            chunk_results = [results[index] for index in chunk_indexes]
+            if isinstance(outcome, Exception):
+                for result in chunk_results:
+                    del result["id"]
+                    result["error"] = str(outcome)
+            else:
+                for index, task_id in zip(chunk_indexes, outcome):
+                    results[index]["id"] = task_ids[index] = task_id
+                created += len(outcome)
+                await ctx.info(jsonutil.dumps({"created": chunk_results}))
+            done += len(chunk_results)
+            await ctx.report_progress(done, total)
+
+    return _fmt({"created": created, "tasks": results})
 
 
 @mcp.tool()
-def odoo_list_tasks(
+async def odoo_list_tasks(
     project_id: int,
     stage_id: int | None = None,
     limit: int = 100,
@@ -297,14 +568,14 @@ def odoo_list_tasks(
         stage_id: Optional stage ID to filter by.
         limit: Max tasks to return (default 100).
     """
-    tasks = get_client().list_tasks(
-        project_id=project_id, stage_id=stage_id, limit=limit
+    tasks = await _run(
+        get_client().list_tasks, project_id=project_id, stage_id=stage_id, limit=limit
     )
     return _fmt(tasks)
 
 
 @mcp.tool()
-def odoo_update_task(
+async def odoo_update_task(
     task_id: int,
     name: str | None = None,
     description: str | None = None,
@@ -319,6 +590,7 @@ def odoo_update_task(
     """Update an existing task.
 
     Only the fields you provide will be changed; others are left untouched.
+    Tags and assignees that already match the task are not rewritten.
 
     Args:
         task_id: The task ID to update.
@@ -349,21 +621,48 @@ def odoo_update_task(
         vals["planned_hours"] = planned_hours
     if date_deadline is not None:
         vals["date_deadline"] = date_deadline
-    if tag_names is not None:
-        tag_ids = client.find_or_create_tags(tag_names)
-        vals["tag_ids"] = [(6, 0, tag_ids)]
-    if user_ids is not None:
-        vals["user_ids"] = [(6, 0, user_ids)]
 
-    if not vals:
+    tag_ids: list[int] | None = None
+    if tag_names is not None or user_ids is not None:
+        # Only replace tags/assignees that actually differ; a no-op (6, 0, ids)
+        # write still makes Odoo rewrite the relation and recompute.
+        read_current = _run(
+            client.read, "project.task", [task_id], ["tag_ids", "user_ids"]
+        )
+        if tag_names is not None:
+            tag_ids, rows = await asyncio.gather(
+                _run(client.find_or_create_tags, tag_names), read_current
+            )
+        else:
+            tag_ids, rows = None, await read_current
+        current = rows[0] if rows else {}
+        if tag_ids is not None and set(tag_ids) != set(current.get("tag_ids") or []):
+            vals["tag_ids"] = [(6, 0, tag_ids)]
+        if user_ids is not None and set(user_ids) != set(
+            current.get("user_ids") or []
+        ):
+            vals["user_ids"] = [(6, 0, user_ids)]
+    elif not vals:
         return _fmt({"error": "No fields provided to update"})
 
-    client.update_task(task_id, vals)
+    if not vals:
+        return _fmt({"updated": False, "task_id": task_id, "fields_changed": []})
+
+    try:
+        await _run(client.update_task, task_id, vals)
+    except OdooRPCError:
+        # A remembered tag may have been deleted in Odoo; retry once
+        stale_ids = tag_ids if "tag_ids" in vals else None
+        fresh_ids = await _refresh_stale_tags(tag_names or [], stale_ids or [])
+        if fresh_ids is None:
+            raise
+        vals["tag_ids"] = [(6, 0, fresh_ids)]
+        await _run(client.update_task, task_id, vals)
     return _fmt({"updated": True, "task_id": task_id, "fields_changed": list(vals.keys())})
 
 
 @mcp.tool()
-def odoo_post_task_message(
+async def odoo_post_task_message(
     task_id: int,
     body: str,
     message_type: str = "comment",
@@ -379,7 +678,8 @@ def odoo_post_task_message(
         message_type: Odoo message type, usually 'comment' or 'notification'.
         subtype_xmlid: Mail subtype XML ID (default 'mail.mt_comment').
     """
-    message_id = get_client().post_task_message(
+    message_id = await _run(
+        get_client().post_task_message,
         task_id=task_id,
         body=body,
         message_type=message_type,
@@ -392,16 +692,17 @@ def odoo_post_task_message(
 
 
 @mcp.tool()
-def odoo_search_users(query: str = "") -> str:
-    """Search for internal Odoo users by name or email.
+async def odoo_search_users(query: str = "", limit: int = 50) -> str:
+    """Search for internal Odoo users by name, email, or login.
 
     Use this to find user IDs before assigning tasks.
 
     Args:
-        query: Search term to match against name or email. Leave empty
-               to list all internal users.
+        query: Search term to match against name, email, or login. Leave
+               empty to list internal users.
+        limit: Max users to return (default 50).
     """
-    users = get_client().search_users(query=query)
+    users = await _run(get_client().search_users, query=query, limit=limit)
     return _fmt(users)
 
 
@@ -409,16 +710,12 @@ def odoo_search_users(query: str = "") -> str:
 
 
 @mcp.tool()
-def odoo_list_tags() -> str:
+async def odoo_list_tags() -> str:
     """List all existing project tags.
 
     Useful to see what tags already exist before creating tasks.
     """
-    tags = get_client().search_read(
-        "project.tags",
-        fields=["id", "name", "color"],
-        order="name asc",
-    )
+    tags = await _run(get_client().list_tags)
     return _fmt(tags)
 
 
@@ -426,7 +723,7 @@ def odoo_list_tags() -> str:
 
 
 @mcp.tool()
-def odoo_search_records(
+async def odoo_search_records(
     model: str,
     domain: list | None = None,
     fields: list[str] | None = None,
@@ -452,26 +749,31 @@ def odoo_search_records(
         limit: Max records to return (default 50).
         order: Sort order (e.g. 'name asc', 'create_date desc').
     """
-    records = get_client().search_read(
-        model, domain=domain, fields=fields, limit=limit, order=order
+    records = await _run(
+        get_client().search_read,
+        model,
+        domain=domain,
+        fields=fields,
+        limit=limit,
+        order=order,
     )
     return _fmt(records)
 
 
 @mcp.tool()
-def odoo_create_record(model: str, values: dict) -> str:
+async def odoo_create_record(model: str, values: dict) -> str:
     """Create a record in any Odoo model. For advanced use cases.
 
     Args:
         model: The Odoo model name.
         values: Dict of field values to set.
     """
-    record_id = get_client().create(model, values)
+    record_id = await _run(get_client().create, model, values)
     return _fmt({"id": record_id, "model": model})
 
 
 @mcp.tool()
-def odoo_update_record(model: str, record_ids: list[int], values: dict) -> str:
+async def odoo_update_record(model: str, record_ids: list[int], values: dict) -> str:
     """Update records in any Odoo model.
 
     Args:
@@ -484,12 +786,12 @@ def odoo_update_record(model: str, record_ids: list[int], values: dict) -> str:
     if not values:
         return _fmt({"error": "values must not be empty"})
 
-    updated = get_client().write(model, record_ids, values)
+    updated = await _run(get_client().write, model, record_ids, values)
     return _fmt({"updated": bool(updated), "model": model, "record_ids": record_ids})
 
 
 @mcp.tool()
-def odoo_delete_record(model: str, record_ids: list[int]) -> str:
+async def odoo_delete_record(model: str, record_ids: list[int]) -> str:
     """Delete records from any Odoo model.
 
     Args:
@@ -499,7 +801,7 @@ def odoo_delete_record(model: str, record_ids: list[int]) -> str:
     if not record_ids:
         return _fmt({"error": "record_ids must not be empty"})
 
-    deleted = get_client().unlink(model, record_ids)
+    deleted = await _run(get_client().unlink, model, record_ids)
     return _fmt({"deleted": bool(deleted), "model": model, "record_ids": record_ids})
 
 
@@ -507,7 +809,7 @@ def odoo_delete_record(model: str, record_ids: list[int]) -> str:
 
 
 @mcp.tool()
-def odoo_create_milestone(
+async def odoo_create_milestone(
     project_id: int,
     name: str,
     deadline: str | None = None,
@@ -525,35 +827,167 @@ def odoo_create_milestone(
     if deadline:
         vals["deadline"] = deadline
 
-    mid = get_client().create("project.milestone", vals)
+    mid = await _run(get_client().create, "project.milestone", vals)
     return _fmt({"id": mid, "name": name, "project_id": project_id})
 
 
 @mcp.tool()
-def odoo_list_milestones(project_id: int) -> str:
+async def odoo_list_milestones(project_id: int) -> str:
     """List milestones for a project.
 
     Args:
         project_id: The project ID.
     """
-    milestones = get_client().search_read(
-        "project.milestone",
-        domain=[["project_id", "=", project_id]],
-        fields=["id", "name", "deadline", "is_reached"],
-        order="deadline asc, id asc",
-    )
+    milestones = await _run(get_client().list_milestones, project_id)
     return _fmt(milestones)
 
 
+# ── Batching ────────────────────────────────────────────────────────
+
+
+@mcp.tool()
+async def odoo_batch_execute(
+    calls: list[dict],
+    max_concurrent: int = 8,
+    stop_on_error: bool = False,
+) -> str:
+    """Run several odoo_* tools in one request.
+
+    Handy for planning preambles such as fetching stages, tags, and users
+    together. Calls run concurrently and results come back in call order.
+
+    Args:
+        calls: List of {"tool": "<tool name>", "args": {...}} dicts, e.g.
+               [{"tool": "odoo_get_project_stages", "args": {"project_id": 3}},
+                {"tool": "odoo_list_tags", "args": {}}].
+        max_concurrent: Max calls running at the same time (default 8).
+        stop_on_error: Skip calls that have not started once one fails. A
+                       call fails when it raises or its tool answers with
+                       an {"error": ...} object.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    failed = asyncio.Event()
+
+    async def run_call(call: dict) -> dict[str, Any]:
+        name = call.get("tool", "")
+        if name not in _BATCH_TOOLS:
+            failed.set()
+            return {"tool": name, "error": f"Unknown tool: {name}"}
+        args = dict(call.get("args") or {})
+        async with semaphore:
+            if stop_on_error and failed.is_set():
+                return {"tool": name, "skipped": True}
+            try:
+                # Go through FastMCP so arguments are validated and coerced
+                # and the request's Context is injected exactly as for a
+                # direct tool call.
+                content = await mcp.call_tool(name, args)
+            except Exception as exc:  # noqa: BLE001 - reported per call
+                failed.set()
+                return {"tool": name, "error": str(exc)}
+            if isinstance(content, tuple):
+                content = content[0]  # (content blocks, structured output)
+            result = jsonutil.loads(content[0].text)
+            if isinstance(result, dict) and "error" in result:
+                failed.set()
+                return {"tool": name, "error": result["error"]}
+            return {"tool": name, "result": result}
+
+    results = await asyncio.gather(*(run_call(call) for call in calls))
+    return _fmt(results)
+
+
+# Tools odoo_batch_execute can dispatch to.
+_BATCH_TOOLS = frozenset(
+    tool.__name__
+    for tool in (
+        odoo_test_connection,
+        odoo_cache_invalidate,
+        odoo_list_projects,
+        odoo_create_project,
+        odoo_update_project,
+        odoo_get_project_stages,
+        odoo_create_task,
+        odoo_create_tasks_batch,
+        odoo_list_tasks,
+        odoo_update_task,
+        odoo_post_task_message,
+        odoo_search_users,
+        odoo_list_tags,
+        odoo_search_records,
+        odoo_create_record,
+        odoo_update_record,
+        odoo_delete_record,
+        odoo_create_milestone,
+        odoo_list_milestones,
+    )
+)
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  ENTRYPOINT
 # ═══════════════════════════════════════════════════════════════════
 
 
+def _warm_client() -> None:
+    """Authenticate and prefetch common lookups before the first tool call."""
+    try:
+        client = get_client()
+        uid = client.uid
+        client.list_projects()
+        client.list_tags()
+    except Exception as exc:  # noqa: BLE001 - tool calls report the real error
+        logger.warning("Could not warm up the Odoo client: %s", exc)
+        return
+    logger.debug("Odoo client warmed up for uid=%s", uid)
+
+
 def main() -> None:
-    """Run the MCP server over stdio."""
+    """Run the MCP server over stdio, or over HTTP with ODOO_MCP_TRANSPORT=http."""
+    transport = os.environ.get("ODOO_MCP_TRANSPORT", "stdio").lower()
+    if transport not in ("stdio", "http"):
+        sys.exit(f"Unknown ODOO_MCP_TRANSPORT {transport!r}; use 'stdio' or 'http'.")
+
     logger.info("Starting Odoo MCP server...")
-    mcp.run(transport="stdio")
+    threading.Thread(target=_warm_client, name="odoo-warmup", daemon=True).start()
+    if transport == "stdio":
+        mcp.run(transport="stdio")
+        return
+
+    # Stateless streamable HTTP: every request is self-contained, so clients
+    # can keep one connection open without holding a session on the server.
+    mcp.settings.host = os.environ.get("ODOO_MCP_HOST", "127.0.0.1")
+    mcp.settings.port = int(os.environ.get("ODOO_MCP_PORT", "8000"))
+    mcp.settings.stateless_http = True
+    # FastMCP only accepts localhost Host headers unless told otherwise.
+    allowed_hosts = [
+        h.strip()
+        for h in os.environ.get("ODOO_MCP_ALLOWED_HOSTS", "").split(",")
+        if h.strip()
+    ]
+    if allowed_hosts:
+        mcp.settings.transport_security = TransportSecuritySettings(
+            enable_dns_rebinding_protection=True,
+            allowed_hosts=allowed_hosts,
+            allowed_origins=[
+                f"{scheme}://{h}" for h in allowed_hosts for scheme in ("http", "https")
+            ],
+        )
+    elif mcp.settings.host not in ("127.0.0.1", "localhost", "::1"):
+        logger.warning(
+            "Binding %s without ODOO_MCP_ALLOWED_HOSTS; Host header checks are off",
+            mcp.settings.host,
+        )
+        mcp.settings.transport_security = TransportSecuritySettings(
+            enable_dns_rebinding_protection=False
+        )
+    logger.info(
+        "Serving MCP over HTTP at http://%s:%s%s",
+        mcp.settings.host,
+        mcp.settings.port,
+        mcp.settings.streamable_http_path,
+    )
+    mcp.run(transport="streamable-http")
 
 
 if __name__ == "__main__":